@@ -15,6 +15,7 @@ Output:
 """
 
 import json
+import re
 import sys
 from collections import Counter
 from pathlib import Path
@@ -55,6 +56,13 @@ MOVEMENT_NAMES = {
     "passacaglia", "chaconne", "fantasia", "ricercar", "invention", "sinfonia",
 }
 
+# Single compiled alternation so movement detection is one linear scan
+# instead of one substring search per name. Longest-first so overlapping
+# names (menuet/menuetto) match the full word, not its prefix.
+MOVEMENT_NAME_RE = re.compile(
+    "|".join(sorted((re.escape(n) for n in MOVEMENT_NAMES), key=len, reverse=True))
+)
+
 DURATION_NAMES = {
     0.25: "sixteenth",
     0.5: "eighth",
@@ -66,6 +74,12 @@ DURATION_NAMES = {
     4.0: "whole",
 }
 
+# Volume scalar -> notated dynamic level (for dynamic_range)
+DYNAMIC_LEVELS = {
+    0.1: "ppp", 0.2: "pp", 0.3: "p", 0.5: "mp",
+    0.6: "mf", 0.75: "f", 0.9: "ff", 1.0: "fff",
+}
+
 
 # ─────────────────────────────────────────────────────────────────
 # CACHING
@@ -142,6 +156,11 @@ def get_part_name(part):
     return f"Part {part.id}" if part.id else "Unknown"
 
 
+def closest_dynamic(val):
+    """Nearest notated dynamic level for a volume scalar."""
+    return DYNAMIC_LEVELS[min(DYNAMIC_LEVELS, key=lambda x: abs(x - val))]
+
+
 def safe_round(value, decimals=2):
     """Safely round a value, returning None if not a number."""
     if value is None:
@@ -218,7 +237,7 @@ def is_multi_movement(score, result):
     text_exprs = list(flat.getElementsByClass(expressions.TextExpression))
     all_text = " ".join(e.content.lower() for e in text_exprs if hasattr(e, "content") and e.content)
 
-    movement_count = sum(1 for name in MOVEMENT_NAMES if name in all_text)
+    movement_count = len(set(MOVEMENT_NAME_RE.findall(all_text)))
     if movement_count >= 2:
         return True
 
@@ -359,26 +378,25 @@ def extract_rhythm(score, result):
         cache = result.get("_cache")
         notes_list = cache.notes if cache else list(score.flatten().notes)
 
-        # Duration distribution
+        # Single pass: duration distribution + off-beat count together
         duration_counts = Counter()
+        off_beat_count = 0
         for n in notes_list:
             ql = n.quarterLength
             name = DURATION_NAMES.get(ql, f"other_{ql}")
             duration_counts[name] += 1
 
-        if duration_counts:
-            result["rhythm_distribution"] = dict(duration_counts.most_common())
-            result["predominant_rhythm"] = duration_counts.most_common(1)[0][0]
-            result["unique_duration_count"] = len(duration_counts)
-
-        # Off-beat note count (for syncopation calculation in Ruby)
-        off_beat_count = 0
-        for n in notes_list:
+            # Off-beat note count (for syncopation calculation in Ruby)
             if hasattr(n, "beat") and n.beat:
                 beat_frac = n.beat % 1
                 if beat_frac > 0.1:
                     off_beat_count += 1
 
+        if duration_counts:
+            result["rhythm_distribution"] = dict(duration_counts.most_common())
+            result["predominant_rhythm"] = duration_counts.most_common(1)[0][0]
+            result["unique_duration_count"] = len(duration_counts)
+
         result["off_beat_count"] = off_beat_count
 
     except Exception as e:
@@ -561,12 +579,7 @@ def extract_notation(score, result):
             dyn_values = [d.volumeScalar for d in dynamics_list if hasattr(d, "volumeScalar") and d.volumeScalar]
             if dyn_values:
                 min_dyn, max_dyn = min(dyn_values), max(dyn_values)
-                dyn_map = {0.1: "ppp", 0.2: "pp", 0.3: "p", 0.5: "mp", 0.6: "mf", 0.75: "f", 0.9: "ff", 1.0: "fff"}
-
-                def closest_dyn(val):
-                    return min(dyn_map.keys(), key=lambda x: abs(x - val))
-
-                result["dynamic_range"] = f"{dyn_map[closest_dyn(min_dyn)]}-{dyn_map[closest_dyn(max_dyn)]}"
+                result["dynamic_range"] = f"{closest_dynamic(min_dyn)}-{closest_dynamic(max_dyn)}"
 
         # Articulations
         notes_with_artic = [n for n in flat.notes if hasattr(n, "articulations") and n.articulations]
@@ -1064,26 +1077,28 @@ def extract_pedal_marks(score, result):
 # MAIN EXTRACTION
 # ─────────────────────────────────────────────────────────────────
 
-def extract(file_path: str) -> dict:
+def extract(source: str | stream.Stream) -> dict:
     """
-    Extract all features from a MusicXML file.
+    Extract all features from a MusicXML file or parsed score.
 
     Args:
-        file_path: Path to MusicXML file (.mxl, .xml, .musicxml)
+        source: Path to MusicXML file (.mxl, .xml, .musicxml), or an
+            already-parsed music21 stream (skips the file round-trip)
 
     Returns:
         Dictionary with all extracted features
     """
+    parsed = isinstance(source, stream.Stream)
     result = {
         "extraction_status": "pending",
         "extraction_error": None,
         "music21_version": music21.VERSION_STR,
-        "musicxml_source": Path(file_path).suffix.lstrip("."),
+        "musicxml_source": "stream" if parsed else Path(source).suffix.lstrip("."),
         "_warnings": [],
     }
 
     try:
-        score = converter.parse(file_path)
+        score = source if parsed else converter.parse(source)
 
         if not isinstance(score, stream.Score):
             wrapper = stream.Score()
@@ -5,6 +5,7 @@ Rails calls this API to perform semantic search.
 
 import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
@@ -17,7 +18,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="ScoreBase RAG API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the embedding model at startup, not on the first query."""
+    try:
+        search_module.warm_up()
+    except Exception as e:
+        logger.warning("Warm-up failed (index may be missing): %s", e)
+    yield
+
+
+app = FastAPI(title="ScoreBase RAG API", lifespan=lifespan)
 
 
 # Request/Response models
@@ -67,7 +79,7 @@ def search(q: str, top_k: int = 10) -> SearchResponse:
     try:
         results = search_module.search(q, top_k=top_k)
     except Exception as e:
-        logger.error(f"Search failed: {e}")
+        logger.exception("Search failed: %s", e)
         raise HTTPException(
             status_code=503,
             detail="Search index not available. Run indexer first."
@@ -109,7 +121,7 @@ def smart_search(q: str, top_k: int = 15) -> SmartSearchResponse:
     try:
         result = search_module.smart_search(q, top_k=top_k)
     except Exception as e:
-        logger.error(f"Smart search failed: {e}")
+        logger.exception("Smart search failed: %s", e)
         raise HTTPException(
             status_code=503,
             detail="Search failed. Check index and API key."
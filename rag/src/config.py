@@ -21,6 +21,11 @@ CHROMA_PATH = BASE_DIR / "data" / "chroma"
 # Embedding model (multilingual for German/French/Italian queries)
 EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
 
+# Quantize the embedding model's Linear layers to int8 for CPU inference.
+# Roughly doubles indexing throughput on AVX-VNNI machines at a small
+# accuracy cost; leave off when embedding on GPU.
+EMBEDDING_QUANTIZE = False
+
 # Search defaults
 DEFAULT_TOP_K = 20
 
@@ -1,10 +1,13 @@
 """LLM integration for RAG search."""
 
-from .groq_client import GroqClient, GroqConfig
+from .cache import CachingChatClient
+from .groq_client import AsyncGroqClient, GroqClient, GroqConfig
 from .lmstudio_client import LMStudioClient, LMStudioConfig
 from .result_selector import ResultSelector, SelectionResult, Recommendation
 
 __all__ = [
+    "AsyncGroqClient",
+    "CachingChatClient",
     "GroqClient",
     "GroqConfig",
     "LMStudioClient",
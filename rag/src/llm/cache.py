@@ -0,0 +1,111 @@
+"""On-disk response cache for LLM chat clients.
+
+Re-running a pipeline over the same corpus re-issues identical LLM calls.
+Wrapping a client in CachingChatClient makes repeated deterministic calls
+free: responses are stored on disk keyed by a hash of (model, prompt,
+system message), so reruns skip the API entirely.
+
+Only deterministic generation is cached - any call with an effective
+temperature above 0 bypasses the cache, since replaying a sampled response
+would silently freeze its randomness.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "scorebase" / "llm"
+
+
+class CachingChatClient:
+    """Wraps any chat client with a persistent on-disk response cache.
+
+    Works with GroqClient and LMStudioClient (anything exposing
+    chat(prompt, system_message, temperature, max_tokens) -> str).
+    """
+
+    def __init__(self, client, cache_dir: Path | str | None = None):
+        """Initialize the cache wrapper.
+
+        Args:
+            client: Underlying chat client (GroqClient or LMStudioClient).
+            cache_dir: Cache directory. Defaults to ~/.cache/scorebase/llm.
+        """
+        self.client = client
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _model_name(self) -> str:
+        """Best-effort model identifier from the wrapped client's config."""
+        config = getattr(self.client, "config", None)
+        if config is None:
+            return ""
+        return getattr(config, "primary_model", None) or getattr(config, "model", "")
+
+    def _effective_temperature(self, temperature: float | None) -> float:
+        if temperature is not None:
+            return temperature
+        config = getattr(self.client, "config", None)
+        return getattr(config, "temperature", 1.0) if config else 1.0
+
+    def _cache_path(self, prompt: str, system_message: str | None) -> Path:
+        key = hashlib.blake2b(
+            (self._model_name() + "\0" + prompt + "\0" + (system_message or "")).encode(),
+            digest_size=16,
+        ).hexdigest()
+        return self.cache_dir / f"{key}.txt"
+
+    def chat(
+        self,
+        prompt: str,
+        system_message: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Send a chat request, serving deterministic repeats from disk.
+
+        Args:
+            prompt: User message
+            system_message: Optional system message
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Returns:
+            Model response text
+        """
+        # Sampled generation isn't reproducible - don't cache it
+        if self._effective_temperature(temperature) > 0:
+            return self.client.chat(
+                prompt=prompt,
+                system_message=system_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+
+        path = self._cache_path(prompt, system_message)
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("LLM cache read failed: %s", e)
+
+        response = self.client.chat(
+            prompt=prompt,
+            system_message=system_message,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+        try:
+            # Write-then-rename so a crashed run never leaves a torn entry
+            tmp = path.with_suffix(f".tmp{os.getpid()}")
+            tmp.write_text(response, encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+        return response
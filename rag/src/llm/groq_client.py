@@ -3,9 +3,19 @@
 Models: llama-3.1-8b-instant (primary), llama-3.3-70b-versatile (fallback)
 """
 
+import logging
 import os
 from dataclasses import dataclass
 
+# Imported once at module load instead of inside every client constructor.
+# Kept optional so the extractor/indexer paths work without the groq extra.
+try:
+    from groq import AsyncGroq, Groq
+except ImportError:
+    AsyncGroq = Groq = None
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GroqConfig:
@@ -29,6 +39,31 @@ class GroqConfig:
         return cls(api_key=api_key)
 
 
+# One SDK client (and its pooled HTTP connections) per API key, shared by all
+# GroqClient instances. Without this, every instance opens a fresh TCP+TLS
+# connection on its first call instead of reusing a warm keep-alive socket.
+_sdk_clients: dict = {}
+_async_sdk_clients: dict = {}
+
+
+def _get_sdk_client(api_key: str):
+    if Groq is None:
+        raise ImportError("groq package is not installed. Run: pip install groq")
+    client = _sdk_clients.get(api_key)
+    if client is None:
+        client = _sdk_clients[api_key] = Groq(api_key=api_key)
+    return client
+
+
+def _get_async_sdk_client(api_key: str):
+    if AsyncGroq is None:
+        raise ImportError("groq package is not installed. Run: pip install groq")
+    client = _async_sdk_clients.get(api_key)
+    if client is None:
+        client = _async_sdk_clients[api_key] = AsyncGroq(api_key=api_key)
+    return client
+
+
 class GroqClient:
     """Groq API client with fallback."""
 
@@ -38,13 +73,11 @@ class GroqClient:
         Args:
             config: Optional config. If None, loads from environment.
         """
-        from groq import Groq
-
         if config is None:
             config = GroqConfig.from_env()
 
         self.config = config
-        self._client = Groq(api_key=config.api_key)
+        self._client = _get_sdk_client(config.api_key)
 
     def chat(
         self,
@@ -90,7 +123,7 @@ class GroqClient:
 
         except Exception as primary_error:
             # Try fallback model
-            print(f"[Groq] Primary model failed: {primary_error}, trying fallback...")
+            logger.warning("Primary model failed: %s, trying fallback...", primary_error)
             try:
                 response = self._client.chat.completions.create(
                     model=self.config.fallback_model,
@@ -109,3 +142,88 @@ class GroqClient:
                     f"Primary ({self.config.primary_model}): {primary_error}\n"
                     f"Fallback ({self.config.fallback_model}): {fallback_error}"
                 )
+
+
+class AsyncGroqClient:
+    """Async Groq API client with fallback.
+
+    Same behavior as GroqClient, but awaitable - callers that have many
+    requests in flight (or run inside the FastAPI event loop) can overlap
+    the network wait instead of blocking on each call in turn.
+    """
+
+    def __init__(self, config: GroqConfig | None = None):
+        """Initialize client.
+
+        Args:
+            config: Optional config. If None, loads from environment.
+        """
+        if config is None:
+            config = GroqConfig.from_env()
+
+        self.config = config
+        self._client = _get_async_sdk_client(config.api_key)
+
+    async def chat(
+        self,
+        prompt: str,
+        system_message: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Send a chat completion request.
+
+        Args:
+            prompt: User message
+            system_message: Optional system message
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Returns:
+            Model response text
+
+        Raises:
+            Exception: If both primary and fallback models fail
+        """
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+
+        temp = temperature if temperature is not None else self.config.temperature
+        tokens = max_tokens if max_tokens is not None else self.config.max_tokens
+
+        # Try primary model
+        try:
+            response = await self._client.chat.completions.create(
+                model=self.config.primary_model,
+                messages=messages,
+                temperature=temp,
+                max_tokens=tokens,
+            )
+            content = response.choices[0].message.content
+            if content is None:
+                raise ValueError("Model returned empty content")
+            return content
+
+        except Exception as primary_error:
+            # Try fallback model
+            logger.warning("Primary model failed: %s, trying fallback...", primary_error)
+            try:
+                response = await self._client.chat.completions.create(
+                    model=self.config.fallback_model,
+                    messages=messages,
+                    temperature=temp,
+                    max_tokens=tokens,
+                )
+                content = response.choices[0].message.content
+                if content is None:
+                    raise ValueError("Fallback model returned empty content")
+                return content
+
+            except Exception as fallback_error:
+                raise RuntimeError(
+                    f"Both models failed.\n"
+                    f"Primary ({self.config.primary_model}): {primary_error}\n"
+                    f"Fallback ({self.config.fallback_model}): {fallback_error}"
+                )
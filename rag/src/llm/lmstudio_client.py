@@ -7,6 +7,12 @@ No rate limiting needed for local inference.
 import os
 from dataclasses import dataclass
 
+# Imported once at module load; optional so non-LLM paths work without it
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None
+
 
 @dataclass
 class LMStudioConfig:
@@ -26,6 +32,23 @@ class LMStudioConfig:
         )
 
 
+# One SDK client per base URL, shared by all LMStudioClient instances so
+# repeated calls reuse the same pooled HTTP connection.
+_sdk_clients: dict = {}
+
+
+def _get_sdk_client(base_url: str):
+    if OpenAI is None:
+        raise ImportError("openai package is not installed. Run: pip install openai")
+    client = _sdk_clients.get(base_url)
+    if client is None:
+        client = _sdk_clients[base_url] = OpenAI(
+            base_url=base_url,
+            api_key="lm-studio",  # LM Studio doesn't require a real key
+        )
+    return client
+
+
 class LMStudioClient:
     """LM Studio client with OpenAI-compatible API."""
 
@@ -35,16 +58,11 @@ class LMStudioClient:
         Args:
             config: Optional config. If None, uses defaults/environment.
         """
-        from openai import OpenAI
-
         if config is None:
             config = LMStudioConfig.from_env()
 
         self.config = config
-        self._client = OpenAI(
-            base_url=config.base_url,
-            api_key="lm-studio",  # LM Studio doesn't require a real key
-        )
+        self._client = _get_sdk_client(config.base_url)
 
     def chat(
         self,
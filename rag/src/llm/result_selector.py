@@ -4,14 +4,19 @@ Takes vector search results and user query, picks the best matches
 with conversational explanations.
 """
 
+import asyncio
 import json
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 
-from .groq_client import GroqClient, GroqConfig
+from .groq_client import AsyncGroqClient, GroqClient, GroqConfig
 
 logger = logging.getLogger(__name__)
 
+# Reused across calls; raw_decode stops at the end of the first valid object
+_JSON_DECODER = json.JSONDecoder()
+
 
 @dataclass
 class Recommendation:
@@ -34,88 +39,122 @@ class SelectionResult:
 class ResultSelector:
     """Selects and explains the best matches from vector search results."""
 
-    PROMPT_TEMPLATE = """<role>
-You are a helpful music librarian assistant for ScoreBase, a sheet music catalog.
-A user is searching for sheet music, and you have {num_results} potential matches from the database.
-Your job is to pick the 3 BEST matches and explain why each one fits the user's needs.
+    # Static instructions live in the system message: providers cache prompt
+    # prefixes per byte-identical segment, so keeping every varying part out
+    # of this block lets the whole thing be reused across calls.
+    SYSTEM_PROMPT = """<role>
+You are a friendly music librarian for ScoreBase, a sheet music catalog.
+Pick the 3 search results that best match the user's query and explain why.
 </role>
 
 <rules>
-- Select exactly 3 scores that best match the user's query
-- If fewer than 3 are good matches, still pick the 3 closest (explain limitations)
-- Write a brief, friendly explanation for each (1-2 sentences)
-- Focus on WHY it matches: difficulty, style, instrumentation, duration, use case
-- Address the user directly ("This piece would work well for your student...")
-- Be honest if a match is imperfect ("While not exactly beginner-level, this...")
-- Write a 1-sentence summary at the end
+- Select exactly 3 scores; if fewer fit well, pick the 3 closest and note the limitations
+- Explain each in 1-2 sentences addressed to the user: why it matches (difficulty, style, instrumentation, duration, use case), honest about imperfect fits
+- Finish with a 1-sentence summary
 - Output valid JSON in the exact format specified
 </rules>
 
-<user_query>
-{user_query}
-</user_query>
-
-<search_results>
-{results_json}
-</search_results>
-
 <output_format>
-{{
+{
   "recommendations": [
-    {{
+    {
       "score_id": <id>,
       "title": "<title from results>",
       "explanation": "<why this matches the query, 1-2 sentences>"
-    }},
-    {{
-      "score_id": <id>,
-      "title": "<title>",
-      "explanation": "<explanation>"
-    }},
-    {{
-      "score_id": <id>,
-      "title": "<title>",
-      "explanation": "<explanation>"
-    }}
+    },
+    ...exactly 3 entries...
   ],
   "summary": "<1 sentence summary, e.g. 'I found 3 beginner-friendly Bach pieces perfect for piano students.'>"
-}}
+}
 </output_format>"""
 
+    # Only the per-call content goes in the user message
+    PROMPT_TEMPLATE = """<user_query>
+{user_query}
+</user_query>
+
+<search_results>
+{results_json}
+</search_results>"""
+
+    # Pre-split once at class load so building the prompt is plain string
+    # concatenation instead of re-parsing the template via str.format per call
+    _PROMPT_HEAD, _rest = PROMPT_TEMPLATE.split("{user_query}")
+    _PROMPT_MID, _PROMPT_TAIL = _rest.split("{results_json}")
+    del _rest
+
     # Use 70B model for better reasoning (only 1 call per search, cost is negligible)
     DEFAULT_MODEL = "llama-3.3-70b-versatile"
 
-    def __init__(self, client: GroqClient | None = None):
+    # Three recommendations (1-2 sentences each) plus a summary fit comfortably
+    # in ~350 tokens of JSON. Capping generation server-side stops a rambling
+    # model from burning decode time we'd only throw away.
+    MAX_RESPONSE_TOKENS = 500
+
+    # search_text can run long; the opening sentences carry the difficulty/
+    # style/instrumentation facts the selector reasons about. Capping each
+    # candidate keeps the 15-result payload to a predictable token budget.
+    MAX_DESCRIPTION_CHARS = 400
+
+    # Repeat searches (same query against the same candidate set) are common
+    # enough - browsers refreshing, users re-running a search - that serving
+    # them from memory skips the multi-second Groq round-trip entirely.
+    CACHE_SIZE = 256
+
+    # Upper bound on in-flight Groq calls from select_many. Groq rate-limits
+    # per minute, so unbounded gather just trades 429 retries for latency;
+    # a handful of concurrent calls keeps throughput up without tripping it.
+    MAX_CONCURRENT_SELECTIONS = 8
+
+    def __init__(
+        self,
+        client: GroqClient | None = None,
+        async_client: AsyncGroqClient | None = None,
+    ):
         """Initialize with LLM client.
 
         Args:
             client: LLM client instance. Defaults to GroqClient with 70B model.
+            async_client: Client for the async path. Created lazily if needed.
         """
         if client is None:
             config = GroqConfig.from_env()
             config.primary_model = self.DEFAULT_MODEL
             client = GroqClient(config)
         self.client = client
+        self.async_client = async_client
+        self._selection_cache: OrderedDict = OrderedDict()
+
+    def _get_async_client(self) -> AsyncGroqClient:
+        if self.async_client is None:
+            config = GroqConfig.from_env()
+            config.primary_model = self.DEFAULT_MODEL
+            self.async_client = AsyncGroqClient(config)
+        return self.async_client
+
+    @staticmethod
+    def _cache_key(query: str, search_results: list[dict], num_recommendations: int) -> tuple:
+        return (
+            query.strip().lower(),
+            tuple(sorted(r.get("score_id") or 0 for r in search_results)),
+            num_recommendations,
+        )
 
     def _parse_response(self, response: str) -> dict | None:
         """Extract JSON from LLM response."""
         if not response:
             return None
 
-        # Try direct parse
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            pass
-
-        # Find JSON object in text
+        # Parse incrementally from each "{" candidate: raw_decode stops at
+        # the object boundary itself, so trailing prose never breaks the
+        # parse and braces inside strings can't cause a mis-slice.
         start = response.find("{")
-        end = response.rfind("}") + 1
-        if start != -1 and end > start:
+        while start != -1:
             try:
-                return json.loads(response[start:end])
+                parsed, _ = _JSON_DECODER.raw_decode(response, start)
+                return parsed
             except json.JSONDecodeError:
-                pass
+                start = response.find("{", start + 1)
 
         return None
 
@@ -142,60 +181,67 @@ Your job is to pick the 3 BEST matches and explain why each one fits the user's
                 success=True
             )
 
-        # Format results for prompt (include only what LLM needs)
-        formatted_results = []
-        for i, r in enumerate(search_results, 1):
-            formatted_results.append({
-                "rank": i,
-                "score_id": r.get("score_id"),
-                "title": r.get("title", "Untitled"),
-                "description": r.get("content", ""),
-                "similarity": round(r.get("similarity", 0), 3)
-            })
-
-        results_json = json.dumps(formatted_results, indent=2)
+        cache_key = self._cache_key(query, search_results, num_recommendations)
+        cached = self._selection_cache.get(cache_key)
+        if cached is not None:
+            self._selection_cache.move_to_end(cache_key)
+            logger.info("Selection cache hit for query: %s", query[:50])
+            return cached
 
         try:
-            prompt = self.PROMPT_TEMPLATE.format(
-                num_results=len(search_results),
-                user_query=query,
-                results_json=results_json
+            prompt = self._build_prompt(query, search_results)
+            response = self.client.chat(
+                prompt=prompt,
+                system_message=self.SYSTEM_PROMPT,
+                max_tokens=self.MAX_RESPONSE_TOKENS,
             )
+            return self._handle_response(response, query, num_recommendations, cache_key)
 
-            response = self.client.chat(prompt=prompt, system_message=None)
-            parsed = self._parse_response(response)
-
-            if not parsed or "recommendations" not in parsed:
-                logger.warning(f"Failed to parse selection response: {response[:200]}")
-                return SelectionResult(
-                    recommendations=[],
-                    summary="I found some matches but had trouble formatting the response.",
-                    success=False,
-                    error="Parse error"
-                )
-
-            # Build recommendation objects
-            recommendations = []
-            for i, rec in enumerate(parsed.get("recommendations", [])[:num_recommendations], 1):
-                recommendations.append(Recommendation(
-                    score_id=rec.get("score_id", 0),
-                    title=rec.get("title", "Untitled"),
-                    explanation=rec.get("explanation", ""),
-                    rank=i
-                ))
-
-            summary = parsed.get("summary", "Here are my recommendations.")
+        except Exception as e:
+            logger.exception("Selection failed: %s", e)
+            return SelectionResult(
+                recommendations=[],
+                summary="Sorry, I encountered an error while selecting recommendations.",
+                success=False,
+                error=str(e)[:200]
+            )
 
-            logger.info(f"Selected {len(recommendations)} recommendations for query: {query[:50]}")
+    async def select_async(
+        self,
+        query: str,
+        search_results: list[dict],
+        num_recommendations: int = 3
+    ) -> SelectionResult:
+        """Async variant of select() - same behavior, awaitable Groq call.
 
+        Lets callers overlap several selections (see select_many) or serve
+        the FastAPI event loop without tying up a worker thread.
+        """
+        if not search_results:
             return SelectionResult(
-                recommendations=recommendations,
-                summary=summary,
+                recommendations=[],
+                summary="No scores found matching your search.",
                 success=True
             )
 
+        cache_key = self._cache_key(query, search_results, num_recommendations)
+        cached = self._selection_cache.get(cache_key)
+        if cached is not None:
+            self._selection_cache.move_to_end(cache_key)
+            logger.info("Selection cache hit for query: %s", query[:50])
+            return cached
+
+        try:
+            prompt = self._build_prompt(query, search_results)
+            response = await self._get_async_client().chat(
+                prompt=prompt,
+                system_message=self.SYSTEM_PROMPT,
+                max_tokens=self.MAX_RESPONSE_TOKENS,
+            )
+            return self._handle_response(response, query, num_recommendations, cache_key)
+
         except Exception as e:
-            logger.error(f"Selection failed: {e}")
+            logger.exception("Selection failed: %s", e)
             return SelectionResult(
                 recommendations=[],
                 summary="Sorry, I encountered an error while selecting recommendations.",
@@ -203,6 +249,104 @@ Your job is to pick the 3 BEST matches and explain why each one fits the user's
                 error=str(e)[:200]
             )
 
+    async def select_many(
+        self,
+        requests: list[tuple[str, list[dict]]],
+        num_recommendations: int = 3
+    ) -> list[SelectionResult]:
+        """Run several selections concurrently.
+
+        Args:
+            requests: (query, search_results) pairs
+            num_recommendations: Number of recommendations per query
+
+        Returns:
+            SelectionResults in the same order as the requests
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SELECTIONS)
+
+        async def _bounded(query: str, results: list[dict]) -> SelectionResult:
+            async with semaphore:
+                return await self.select_async(query, results, num_recommendations)
+
+        return await asyncio.gather(*(
+            _bounded(query, results) for query, results in requests
+        ))
+
+    def _clip_description(self, text: str) -> str:
+        if len(text) > self.MAX_DESCRIPTION_CHARS:
+            return text[:self.MAX_DESCRIPTION_CHARS] + "..."
+        return text
+
+    def _build_prompt(self, query: str, search_results: list[dict]) -> str:
+        """Format candidates and fill the user-message template."""
+        # Include only what the LLM needs
+        formatted_results = [
+            {
+                "rank": i,
+                "score_id": r.get("score_id"),
+                "title": r.get("title") or "Untitled",
+                "description": self._clip_description(r.get("content") or ""),
+                "similarity": round(r.get("similarity") or 0, 3),
+            }
+            for i, r in enumerate(search_results, 1)
+        ]
+
+        # Compact JSON - the model doesn't need pretty-printing, and the
+        # indentation whitespace was billed as input tokens on every call
+        results_json = json.dumps(formatted_results, ensure_ascii=False,
+                                  separators=(",", ":"))
+
+        return "".join((
+            self._PROMPT_HEAD, query, self._PROMPT_MID, results_json, self._PROMPT_TAIL
+        ))
+
+    def _handle_response(
+        self,
+        response: str,
+        query: str,
+        num_recommendations: int,
+        cache_key: tuple,
+    ) -> SelectionResult:
+        """Parse the model response into a SelectionResult and cache it."""
+        parsed = self._parse_response(response)
+
+        if not parsed or "recommendations" not in parsed:
+            logger.warning("Failed to parse selection response: %s", response[:200])
+            return SelectionResult(
+                recommendations=[],
+                summary="I found some matches but had trouble formatting the response.",
+                success=False,
+                error="Parse error"
+            )
+
+        # Build recommendation objects
+        recommendations = []
+        for i, rec in enumerate(parsed.get("recommendations", [])[:num_recommendations], 1):
+            recommendations.append(Recommendation(
+                score_id=rec.get("score_id", 0),
+                title=rec.get("title", "Untitled"),
+                explanation=rec.get("explanation", ""),
+                rank=i
+            ))
+
+        summary = parsed.get("summary", "Here are my recommendations.")
+
+        logger.info("Selected %d recommendations for query: %s", len(recommendations), query[:50])
+
+        selection = SelectionResult(
+            recommendations=recommendations,
+            summary=summary,
+            success=True
+        )
+
+        # Only successful selections are worth replaying
+        self._selection_cache[cache_key] = selection
+        if len(self._selection_cache) > self.CACHE_SIZE:
+            self._selection_cache.popitem(last=False)
+
+        return selection
+
     def format_response(self, result: SelectionResult) -> str:
         """Format selection result as readable text.
 
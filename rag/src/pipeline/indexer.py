@@ -5,6 +5,7 @@ Rails generates search_text. Python just indexes it.
 """
 
 import logging
+from collections import Counter
 
 from haystack import Document
 from haystack.components.embedders import SentenceTransformersDocumentEmbedder
@@ -18,23 +19,95 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Documents embedded + written to Chroma per chunk. Bounds peak memory and
+# gives a natural checkpoint granularity for interrupted runs.
+EMBED_CHUNK_SIZE = 256
 
-def get_indexed_score_ids(document_store: ChromaDocumentStore) -> set[int]:
-    """Get score IDs already in ChromaDB."""
+
+# Page size for the full-collection scan fallback
+SCAN_PAGE_SIZE = 5000
+
+# Cache the embedder so repeated build_index calls in one process skip the
+# model load (the slowest part of a short incremental index run)
+_embedder = None
+
+
+def get_embedder() -> SentenceTransformersDocumentEmbedder:
+    """Get or create the warmed document embedder (cached)."""
+    global _embedder
+
+    if _embedder is None:
+        logger.info("Loading embedding model: %s", config.EMBEDDING_MODEL)
+        embedder = SentenceTransformersDocumentEmbedder(model=config.EMBEDDING_MODEL)
+        embedder.warm_up()
+        if config.EMBEDDING_QUANTIZE:
+            _quantize_embedder(embedder)
+        _embedder = embedder
+    return _embedder
+
+
+def _quantize_embedder(embedder: SentenceTransformersDocumentEmbedder):
+    """Quantize the embedder's Linear layers to int8 for CPU inference."""
+    import torch
+
+    logger.info("Quantizing embedding model to int8")
+    model = embedder.embedding_backend.model
+    torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+def _score_ids_from_doc_ids(doc_ids: list[str]) -> set[int]:
+    """Recover score IDs from "score_{id}" document IDs."""
+    return {
+        int(doc_id.split("_", 1)[1])
+        for doc_id in doc_ids
+        if doc_id.startswith("score_")
+    }
+
+
+def get_indexed_score_ids(
+    document_store: ChromaDocumentStore,
+    candidate_ids: list[int] | None = None,
+) -> set[int]:
+    """Get score IDs already in ChromaDB.
+
+    Args:
+        candidate_ids: When given, only these IDs are checked - Chroma
+            filters server-side, so the cost scales with the batch instead
+            of the whole collection. Without it, the collection is scanned
+            in pages rather than materialized in one call.
+    """
     try:
         if document_store.count_documents() == 0:
             return set()
 
         collection = document_store._collection
-        results = collection.get(include=["metadatas"])
 
-        return {
-            meta["score_id"]
-            for meta in results.get("metadatas", [])
-            if meta and "score_id" in meta
-        }
+        # Document IDs are "score_{id}" (see build_index), so the score ID
+        # can be read straight off the ID column. include=[] lets Chroma
+        # skip materializing the metadata dicts entirely.
+        if candidate_ids is not None:
+            results = collection.get(
+                where={"score_id": {"$in": list(candidate_ids)}},
+                include=[],
+            )
+            return _score_ids_from_doc_ids(results.get("ids", []))
+
+        indexed: set[int] = set()
+        offset = 0
+        while True:
+            results = collection.get(
+                include=[], limit=SCAN_PAGE_SIZE, offset=offset
+            )
+            doc_ids = results.get("ids", [])
+            if not doc_ids:
+                break
+            indexed.update(_score_ids_from_doc_ids(doc_ids))
+            offset += len(doc_ids)
+        return indexed
     except Exception as e:
-        logger.warning(f"Could not fetch existing IDs: {e}")
+        logger.warning("Could not fetch existing IDs: %s", e)
         return set()
 
 
@@ -49,25 +122,25 @@ def build_index(limit: int = 100, ids: list[int] | None = None):
     config.CHROMA_PATH.mkdir(parents=True, exist_ok=True)
     document_store = ChromaDocumentStore(persist_path=str(config.CHROMA_PATH))
 
-    # Get already indexed
-    existing_ids = get_indexed_score_ids(document_store)
-    if existing_ids:
-        logger.info(f"Found {len(existing_ids)} already indexed scores")
-
     # Fetch scores with search_text
     if ids:
-        logger.info(f"Fetching scores by IDs: {ids}")
+        logger.info("Fetching scores by IDs: %s", ids)
         scores = db.get_scores_by_ids(ids)
     else:
-        logger.info(f"Fetching templated scores (limit={limit})")
+        logger.info("Fetching templated scores (limit=%d)", limit)
         scores = db.get_templated_scores(limit=limit)
 
-    logger.info(f"Got {len(scores)} scores from database")
+    logger.info("Got %d scores from database", len(scores))
 
-    # Filter already indexed
+    # Filter already indexed - check only this batch's IDs, not the
+    # whole collection
+    existing_ids = get_indexed_score_ids(
+        document_store, candidate_ids=[s["id"] for s in scores]
+    )
     if existing_ids:
+        logger.info("Found %d already indexed scores", len(existing_ids))
         scores = [s for s in scores if s["id"] not in existing_ids]
-        logger.info(f"After filtering: {len(scores)} new scores to index")
+        logger.info("After filtering: %d new scores to index", len(scores))
 
     if not scores:
         logger.info("No new scores to index.")
@@ -83,30 +156,62 @@ def build_index(limit: int = 100, ids: list[int] | None = None):
         )
         documents.append(doc)
 
-    logger.info(f"Created {len(documents)} documents")
+    logger.info("Created %d documents", len(documents))
 
     # Embed
-    logger.info(f"Loading embedding model: {config.EMBEDDING_MODEL}")
-    embedder = SentenceTransformersDocumentEmbedder(model=config.EMBEDDING_MODEL)
-    embedder.warm_up()
-
-    logger.info("Embedding documents...")
-    result = embedder.run(documents)
-    embedded_docs = result["documents"]
-
-    # Store
-    logger.info("Storing in ChromaDB...")
-    document_store.write_documents(embedded_docs, policy="skip")
-
-    # Mark as indexed in Rails DB
-    indexed_ids = [s["id"] for s in scores]
-    db.mark_indexed(indexed_ids)
-
-    logger.info(f"Done! Indexed {len(embedded_docs)} documents to {config.CHROMA_PATH}")
+    embedder = get_embedder()
+
+    # Embed and store in streaming chunks: peak memory stays bounded by the
+    # chunk size instead of the corpus, Chroma starts filling immediately,
+    # and each completed chunk is checkpointed in the Rails DB so an
+    # interrupted run resumes where it stopped.
+    logger.info("Embedding and storing %d documents in chunks of %d...",
+                len(documents), EMBED_CHUNK_SIZE)
+
+    # Reissues of the same piece can share identical search_text - embed each
+    # distinct text once and fan the vector back out to the duplicates.
+    # Only texts that actually repeat are kept across chunks.
+    content_counts = Counter(doc.content for doc in documents)
+    shared_embeddings = {}
+    indexed_count = 0
+
+    for chunk_start in range(0, len(documents), EMBED_CHUNK_SIZE):
+        chunk = documents[chunk_start:chunk_start + EMBED_CHUNK_SIZE]
+
+        to_embed = {}
+        for doc in chunk:
+            if doc.content not in shared_embeddings:
+                to_embed.setdefault(doc.content, doc)
+
+        chunk_embeddings = {}
+        if to_embed:
+            # Sort by text length so each transformer mini-batch pads to
+            # similarly-sized inputs instead of the longest text in the
+            # chunk. Results are keyed by content, so order doesn't need
+            # restoring afterwards.
+            batch = sorted(to_embed.values(), key=lambda d: len(d.content))
+            embedded = embedder.run(batch)["documents"]
+            chunk_embeddings = {d.content: d.embedding for d in embedded}
+
+        for content, embedding in chunk_embeddings.items():
+            if content_counts[content] > 1:
+                shared_embeddings[content] = embedding
+
+        for doc in chunk:
+            doc.embedding = chunk_embeddings.get(doc.content) or shared_embeddings[doc.content]
+
+        document_store.write_documents(chunk, policy="skip")
+
+        # Checkpoint this chunk in the Rails DB
+        db.mark_indexed([doc.meta["score_id"] for doc in chunk])
+        indexed_count += len(chunk)
+        logger.info("Indexed %d/%d documents", indexed_count, len(documents))
+
+    logger.info("Done! Indexed %d documents to %s", indexed_count, config.CHROMA_PATH)
 
     # Show stats
     stats = db.get_stats()
-    logger.info(f"RAG stats: {stats}")
+    logger.info("RAG stats: %s", stats)
 
 
 def main():
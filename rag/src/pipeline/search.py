@@ -1,7 +1,8 @@
 """Search pipeline using Haystack + LLM result selection."""
 
 import os
-from haystack import Pipeline
+from collections import OrderedDict
+
 from haystack.components.embedders import SentenceTransformersTextEmbedder
 from haystack_integrations.document_stores.chroma import ChromaDocumentStore
 from haystack_integrations.components.retrievers.chroma import ChromaEmbeddingRetriever
@@ -9,40 +10,79 @@ from haystack_integrations.components.retrievers.chroma import ChromaEmbeddingRe
 from .. import config
 from ..llm import ResultSelector
 
-# Cache the pipeline to avoid reloading on every search
-_pipeline = None
+# Cache the components to avoid reloading on every search
+_components = None
+
+# Cache the selector so every smart search reuses one client (and its
+# pooled HTTP connections) instead of constructing a fresh one
+_selector = None
+
+# Recent query embeddings, LRU-evicted. Repeat searches (reruns,
+# pagination, browser refreshes) hit the same strings, and a cache hit
+# skips the model forward entirely.
+EMBED_CACHE_SIZE = 1024
+_embed_cache: OrderedDict = OrderedDict()
+
 
+def get_selector() -> ResultSelector:
+    """Get or create the LLM result selector (cached)."""
+    global _selector
 
-def get_pipeline() -> Pipeline:
-    """Get or create search pipeline (cached)."""
-    global _pipeline
+    if _selector is None:
+        _selector = ResultSelector()
+    return _selector
+
+
+def get_components() -> tuple[SentenceTransformersTextEmbedder, ChromaEmbeddingRetriever]:
+    """Get or create the (embedder, retriever) pair (cached).
+
+    The components are called directly: a Haystack Pipeline around a
+    two-node embed-then-retrieve graph is pure dispatch overhead on the
+    query path.
+    """
+    global _components
 
-    if _pipeline is not None:
-        return _pipeline
+    if _components is not None:
+        return _components
 
     # Connect to ChromaDB
     document_store = ChromaDocumentStore(persist_path=str(config.CHROMA_PATH))
 
-    # Build pipeline
-    pipeline = Pipeline()
-
     # Text -> Embedding
-    pipeline.add_component(
-        "embedder",
-        SentenceTransformersTextEmbedder(model=config.EMBEDDING_MODEL, progress_bar=False)
+    embedder = SentenceTransformersTextEmbedder(
+        model=config.EMBEDDING_MODEL, progress_bar=False
     )
 
     # Embedding -> Similar documents
-    pipeline.add_component(
-        "retriever",
-        ChromaEmbeddingRetriever(document_store=document_store, top_k=config.DEFAULT_TOP_K)
+    retriever = ChromaEmbeddingRetriever(
+        document_store=document_store, top_k=config.DEFAULT_TOP_K
     )
 
-    # Connect components
-    pipeline.connect("embedder.embedding", "retriever.query_embedding")
+    _components = (embedder, retriever)
+    return _components
+
+
+def warm_up():
+    """Load the embedding model and pay first-forward init up front.
+
+    Called at API startup so the first user query doesn't absorb the
+    model load plus the lazy first-forward cost.
+    """
+    embedder, _ = get_components()
+    embedder.warm_up()
+    if config.EMBEDDING_QUANTIZE:
+        _quantize_embedder(embedder)
+    embedder.run(text="warm up")
+
 
-    _pipeline = pipeline
-    return pipeline
+def _quantize_embedder(embedder: SentenceTransformersTextEmbedder):
+    """Quantize the query embedder's Linear layers to int8 for CPU inference."""
+    import torch
+
+    torch.ao.quantization.quantize_dynamic(
+        embedder.embedding_backend.model, {torch.nn.Linear},
+        dtype=torch.qint8, inplace=True
+    )
 
 
 def search(query: str, top_k: int = 10) -> list[dict]:
@@ -55,15 +95,60 @@ def search(query: str, top_k: int = 10) -> list[dict]:
     Returns:
         List of results with score_id, content (LLM description), similarity
     """
-    pipeline = get_pipeline()
+    embedding = _embed_query(query)
+    _, retriever = get_components()
 
-    result = pipeline.run({
-        "embedder": {"text": query},
-        "retriever": {"top_k": top_k}
-    })
+    documents = retriever.run(query_embedding=embedding, top_k=top_k)["documents"]
+    return _to_results(documents)
+
+
+def _embed_query(query: str) -> list[float]:
+    """Embed a query, serving repeats from the LRU cache."""
+    key = query.strip().lower()
+    cached = _embed_cache.get(key)
+    if cached is not None:
+        _embed_cache.move_to_end(key)
+        return cached
+
+    embedder, _ = get_components()
+    embedder.warm_up()
+    embedding = embedder.run(text=query)["embedding"]
+
+    _embed_cache[key] = embedding
+    if len(_embed_cache) > EMBED_CACHE_SIZE:
+        _embed_cache.popitem(last=False)
+    return embedding
+
+
+def search_many(queries: list[str], top_k: int = 10) -> list[list[dict]]:
+    """Search for several queries at once (vector search only).
+
+    All queries go through the embedding model in one batched forward
+    instead of one call each, then retrieval runs per embedding.
+
+    Args:
+        queries: Natural language search queries
+        top_k: Number of results per query
+
+    Returns:
+        One result list per query, in the same order as the queries,
+        each shaped like the return value of search()
+    """
+    if not queries:
+        return []
+
+    embedder, retriever = get_components()
+    embedder.warm_up()
+    embeddings = embedder.embedding_backend.embed(list(queries))
+
+    return [
+        _to_results(retriever.run(query_embedding=embedding, top_k=top_k)["documents"])
+        for embedding in embeddings
+    ]
 
-    documents = result["retriever"]["documents"]
 
+def _to_results(documents) -> list[dict]:
+    """Map retrieved documents to the result dicts the API returns."""
     return [
         {
             "score_id": doc.meta.get("score_id"),
@@ -102,7 +187,7 @@ def smart_search(query: str, top_k: int = 15, num_recommendations: int = 3) -> d
         }
 
     # Step 2: LLM selects and explains best matches
-    selector = ResultSelector()
+    selector = get_selector()
     selection = selector.select(
         query=query,
         search_results=raw_results,
@@ -84,61 +84,60 @@ def save_temp(score):
     return path
 
 
+def extract_temp(score):
+    """Round-trip a score through a temp file and extract it."""
+    path = save_temp(score)
+    try:
+        return extract(path)
+    finally:
+        Path(path).unlink()
+
+
+# Extraction is the expensive part; each score is extracted once per
+# module and the assertions share the result dict. The simple score
+# keeps the temp-file round-trip to cover the file-loading branch; the
+# others feed the score object to extract() directly.
+
+@pytest.fixture(scope="module")
+def simple_result():
+    return extract_temp(make_simple_score())
+
+
+@pytest.fixture(scope="module")
+def satb_result():
+    return extract(make_satb_score())
+
+
+@pytest.fixture(scope="module")
+def piano_result():
+    return extract(make_piano_score())
+
+
 class TestExtraction:
     """Core extraction tests."""
 
-    def test_extraction_succeeds(self):
-        path = save_temp(make_simple_score())
-        try:
-            result = extract(path)
-            assert result["extraction_status"] == "extracted"
-        finally:
-            Path(path).unlink()
+    def test_extraction_succeeds(self, simple_result):
+        assert simple_result["extraction_status"] == "extracted"
 
-    def test_pitch_range_extracted(self):
-        path = save_temp(make_simple_score())
-        try:
-            result = extract(path)
-            assert result["lowest_pitch"] == "C4"
-            assert result["highest_pitch"] == "C5"
-            assert result["ambitus_semitones"] == 12
-        finally:
-            Path(path).unlink()
+    def test_pitch_range_extracted(self, simple_result):
+        assert simple_result["lowest_pitch"] == "C4"
+        assert simple_result["highest_pitch"] == "C5"
+        assert simple_result["ambitus_semitones"] == 12
 
-    def test_tempo_extracted(self):
-        path = save_temp(make_simple_score())
-        try:
-            result = extract(path)
-            assert result["tempo_bpm"] == 120
-        finally:
-            Path(path).unlink()
+    def test_tempo_extracted(self, simple_result):
+        assert simple_result["tempo_bpm"] == 120
 
-    def test_time_signature_extracted(self):
-        path = save_temp(make_simple_score())
-        try:
-            result = extract(path)
-            assert result["time_signature"] == "4/4"
-        finally:
-            Path(path).unlink()
+    def test_time_signature_extracted(self, simple_result):
+        assert simple_result["time_signature"] == "4/4"
 
-    def test_key_detected(self):
-        path = save_temp(make_simple_score())
-        try:
-            result = extract(path)
-            # C major and A minor are relative keys (same notes) - either is valid
-            assert result["key_signature"] in ["C major", "A minor"]
-        finally:
-            Path(path).unlink()
+    def test_key_detected(self, simple_result):
+        # C major and A minor are relative keys (same notes) - either is valid
+        assert simple_result["key_signature"] in ["C major", "A minor"]
 
-    def test_multipart_extraction(self):
-        path = save_temp(make_satb_score())
-        try:
-            result = extract(path)
-            assert result["num_parts"] == 4
-            assert "Soprano" in result["part_names"]
-            assert "Bass" in result["part_names"]
-        finally:
-            Path(path).unlink()
+    def test_multipart_extraction(self, satb_result):
+        assert satb_result["num_parts"] == 4
+        assert "Soprano" in satb_result["part_names"]
+        assert "Bass" in satb_result["part_names"]
 
     def test_missing_file_fails_gracefully(self):
         result = extract("/no/such/file.mxl")
@@ -149,26 +148,16 @@ class TestExtraction:
 class TestAdvancedFeatures:
     """Tests for advanced extraction features."""
 
-    def test_hand_span_extracted_for_piano(self):
+    def test_hand_span_extracted_for_piano(self, piano_result):
         """Piano scores should have max_chord_span."""
-        path = save_temp(make_piano_score())
-        try:
-            result = extract(path)
-            assert "max_chord_span" in result
-            assert result["max_chord_span"] == 12  # C4 to C5 = octave
-        finally:
-            Path(path).unlink()
+        assert "max_chord_span" in piano_result
+        assert piano_result["max_chord_span"] == 12  # C4 to C5 = octave
 
-    def test_tessitura_extracted(self):
+    def test_tessitura_extracted(self, satb_result):
         """Parts should have tessitura (average pitch)."""
-        path = save_temp(make_satb_score())
-        try:
-            result = extract(path)
-            assert "tessitura" in result
-            assert "Soprano" in result["tessitura"]
-            assert "average_midi" in result["tessitura"]["Soprano"]
-        finally:
-            Path(path).unlink()
+        assert "tessitura" in satb_result
+        assert "Soprano" in satb_result["tessitura"]
+        assert "average_midi" in satb_result["tessitura"]["Soprano"]
 
 
 class TestMultiMovement: